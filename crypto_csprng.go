@@ -2,14 +2,27 @@ package main
 
 import (
 	"crypto/rand"
+	"sync"
+)
+
+const (
+	CRYPTO_POOL_SIZE        = 64 * 1024 // 64 KB
+	CRYPTO_POOL_MAX_REQUEST = 4 * 1024  // Larger requests bypass the pool
 )
 
 // CryptoCSPRNG implements a wrapper for the operating Crypto's CSPRNG
-type CryptoCSPRNG struct{}
+type CryptoCSPRNG struct {
+	pool  []byte
+	pos   int
+	mutex sync.Mutex
+}
 
 // NewCryptoCSPRNG creates a new Crypto CSPRNG
 func NewCryptoCSPRNG() *CryptoCSPRNG {
-	return &CryptoCSPRNG{}
+	return &CryptoCSPRNG{
+		pool: make([]byte, CRYPTO_POOL_SIZE),
+		pos:  CRYPTO_POOL_SIZE, // Empty until the first small request
+	}
 }
 
 // Name returns the generator name
@@ -20,6 +33,28 @@ func (s *CryptoCSPRNG) Name() string {
 // GenerateBytes generates cryptographically secure random bytes
 func (s *CryptoCSPRNG) GenerateBytes(numBytes int) ([]byte, error) {
 	result := make([]byte, numBytes)
-	_, err := rand.Read(result)
-	return result, err
-}
\ No newline at end of file
+
+	// Large requests are read straight from the OS
+	if numBytes > CRYPTO_POOL_MAX_REQUEST {
+		_, err := rand.Read(result)
+		return result, err
+	}
+
+	s.mutex.Lock()
+	defer s.mutex.Unlock()
+
+	// Serve small requests from a pool refilled in bulk to amortize the syscall
+	if s.pos+numBytes > len(s.pool) {
+		if _, err := rand.Read(s.pool); err != nil {
+			return result, err
+		}
+		s.pos = 0
+	}
+
+	copy(result, s.pool[s.pos:])
+	// Wipe served bytes so they are not left in the pool after use
+	clear(s.pool[s.pos : s.pos+numBytes])
+	s.pos += numBytes
+
+	return result, nil
+}
@@ -0,0 +1,66 @@
+package main
+
+import (
+	"crypto/hmac"
+	"crypto/sha256"
+	"encoding/binary"
+	"runtime"
+	"sync"
+)
+
+const PARALLEL_BLOCK_THRESHOLD = 64 * 1024 // 64 KB
+
+// generateBlocks fills result with HMAC-SHA256(state, counter+i) blocks and returns
+// the final block. Every block depends only on the state and its own counter, so
+// large requests are split across goroutines.
+func generateBlocks(result []byte, state []byte, counter uint64) []byte {
+	if len(result) == 0 {
+		return nil
+	}
+	fullBlocks := len(result) / sha256.Size
+	blocks := result[:fullBlocks*sha256.Size]
+
+	workers := runtime.NumCPU()
+	switch {
+	case fullBlocks == 0:
+		// Sub-block requests only need the tail below; skip keying an unused HMAC
+	case len(blocks) < PARALLEL_BLOCK_THRESHOLD || workers < 2:
+		hmacBlocks(blocks, state, counter)
+	default:
+		var wg sync.WaitGroup
+		perWorker := (fullBlocks + workers - 1) / workers
+		for start := 0; start < fullBlocks; start += perWorker {
+			end := min(start+perWorker, fullBlocks)
+			wg.Add(1)
+			go func(start, end int) {
+				defer wg.Done()
+				hmacBlocks(blocks[start*sha256.Size:end*sha256.Size], state, counter+uint64(start))
+			}(start, end)
+		}
+		wg.Wait()
+	}
+
+	// Copy only the needed prefix of a trailing partial block
+	if tail := len(result) - len(blocks); tail > 0 {
+		var last [sha256.Size]byte
+		hmacBlocks(last[:], state, counter+uint64(fullBlocks))
+		copy(result[len(blocks):], last[:tail])
+		return last[:]
+	}
+	return blocks[len(blocks)-sha256.Size:]
+}
+
+// hmacBlocks writes consecutive counter blocks into dst, whose length is a multiple of the block size
+func hmacBlocks(dst []byte, state []byte, counter uint64) {
+	// Key the HMAC once; Reset restores the precomputed keyed state for each block
+	mac := hmac.New(sha256.New, state)
+	var counterBytes [8]byte
+	for generated := 0; generated < len(dst); generated += sha256.Size {
+		mac.Reset()
+		binary.BigEndian.PutUint64(counterBytes[:], counter)
+		mac.Write(counterBytes[:])
+		mac.Sum(dst[generated:generated])
+
+		counter++
+	}
+}
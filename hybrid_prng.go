@@ -5,10 +5,8 @@ import (
 	"crypto/rand"
 	"crypto/sha256"
 	"encoding/binary"
-	"fmt"
 	"io"
 	"net/http"
-	"strconv"
 	"sync"
 	"time"
 )
@@ -16,7 +14,7 @@ import (
 // HybridCSPRNG implements a hybrid cryptographically secure pseudo-random number generator
 // combining weather data entropy with system entropy
 type HybridCSPRNG struct {
-	state          []byte
+	state          [sha256.Size]byte
 	counter        uint64
 	mutex          sync.Mutex
 	client         *http.Client
@@ -58,9 +56,9 @@ func (h *HybridCSPRNG) reseed() {
 	newEntropy := mac.Sum(nil)
 
 	// Mix the new, conditioned entropy with the old state
-	oldStateMac := hmac.New(sha256.New, h.state)
+	oldStateMac := hmac.New(sha256.New, h.state[:])
 	oldStateMac.Write(newEntropy)
-	h.state = oldStateMac.Sum(nil)
+	oldStateMac.Sum(h.state[:0])
 
 	h.lastReseed = time.Now()
 	h.bytesGenerated = 0
@@ -73,16 +71,16 @@ func (h *HybridCSPRNG) getWeatherEntropy() []byte {
 	duration := time.Since(start)
 
 	if err != nil {
-		return []byte(fmt.Sprintf("error:%d", duration.Nanoseconds()))
+		return binary.BigEndian.AppendUint64([]byte("error:"), uint64(duration.Nanoseconds()))
 	}
 	defer resp.Body.Close()
 
 	body, err := io.ReadAll(resp.Body)
 	if err != nil {
-		return []byte(fmt.Sprintf("readerror:%d", duration.Nanoseconds()))
+		return binary.BigEndian.AppendUint64([]byte("readerror:"), uint64(duration.Nanoseconds()))
 	}
 
-	return append(body, []byte(strconv.FormatInt(duration.Nanoseconds(), 10))...)
+	return binary.BigEndian.AppendUint64(body, uint64(duration.Nanoseconds()))
 }
 
 // GenerateBytes generates cryptographically secure random bytes
@@ -96,26 +94,15 @@ func (h *HybridCSPRNG) GenerateBytes(numBytes int) ([]byte, error) {
 	}
 
 	result := make([]byte, numBytes)
-	generated := 0
+	numBlocks := (numBytes + sha256.Size - 1) / sha256.Size
 
-	for generated < numBytes {
-		mac := hmac.New(sha256.New, h.state)
-		counterBytes := make([]byte, 8)
-		binary.BigEndian.PutUint64(counterBytes, h.counter)
-		mac.Write(counterBytes)
-		block := mac.Sum(nil)
+	block := generateBlocks(result, h.state[:], h.counter)
+	h.counter += uint64(numBlocks)
 
-		toCopy := min(len(block), numBytes-generated)
-		copy(result[generated:], block[:toCopy])
-
-		generated += toCopy
-		h.counter++
-
-		// Update state for next block generation
-		updateMac := hmac.New(sha256.New, h.state)
-		updateMac.Write(block)
-		h.state = updateMac.Sum(nil)
-	}
+	// Update state once per call; each block is already bound to a unique counter
+	updateMac := hmac.New(sha256.New, h.state[:])
+	updateMac.Write(block)
+	updateMac.Sum(h.state[:0])
 
 	h.bytesGenerated += numBytes
 	return result, nil
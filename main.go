@@ -3,6 +3,7 @@ package main
 import (
 	"fmt"
 	"math"
+	"math/bits"
 	"os"
 	"text/tabwriter"
 	"time"
@@ -13,6 +14,7 @@ type TestResult struct {
 	Name                 string
 	TotalTime            time.Duration
 	AvgOpsPerSec         float64
+	PeakOpsPerSec        float64
 	AvgChiSquare         float64
 	AvgShannonEntropy    float64
 	AvgNISTMonobitPValue float64
@@ -26,19 +28,24 @@ type Generator interface {
 }
 
 // Statistical analysis functions
-func calculateChiSquare(data []byte) float64 {
-	counts := make(map[byte]int, 256)
+func byteHistogram(data []byte) [256]int {
+	var counts [256]int
 	for _, b := range data {
 		counts[b]++
 	}
+	return counts
+}
+
+func calculateChiSquare(data []byte) float64 {
 	if len(data) == 0 {
 		return 0
 	}
+	counts := byteHistogram(data)
 
 	expected := float64(len(data)) / 256.0
 	var chiSquareStat float64
 	for i := 0; i < 256; i++ {
-		observed := float64(counts[byte(i)])
+		observed := float64(counts[i])
 		diff := observed - expected
 		chiSquareStat += (diff * diff) / expected
 	}
@@ -50,10 +57,7 @@ func calculateShannonEntropy(data []byte) float64 {
 		return 0.0
 	}
 
-	counts := make(map[byte]int)
-	for _, b := range data {
-		counts[b]++
-	}
+	counts := byteHistogram(data)
 
 	var entropy float64
 	dataLen := float64(len(data))
@@ -72,16 +76,12 @@ func nistFrequencyMonobitTest(data []byte) float64 {
 		return 0.0
 	}
 
-	s := 0
+	// Count set bits with popcount; s = ones - zeros
+	ones := 0
 	for _, b := range data {
-		for i := 0; i < 8; i++ {
-			if (b>>i)&1 == 1 {
-				s++
-			} else {
-				s--
-			}
-		}
+		ones += bits.OnesCount8(b)
 	}
+	s := 2*ones - n
 
 	sObs := math.Abs(float64(s)) / math.Sqrt(float64(n))
 	return math.Erfc(sObs / math.Sqrt2)
@@ -104,12 +104,31 @@ func showProgress(current, total int, name string) {
 	fmt.Printf("\r%s: [%s] %.1f%% (%d/%d)", name, string(bar), percent, current, total)
 }
 
+// generateChunked fills buf with chunkSize-byte GenerateBytes calls
+func generateChunked(generator Generator, buf []byte, chunkSize int) error {
+	for off := 0; off < len(buf); off += chunkSize {
+		chunk, err := generator.GenerateBytes(min(chunkSize, len(buf)-off))
+		if err != nil {
+			return err
+		}
+		copy(buf[off:], chunk)
+	}
+	return nil
+}
+
 // Benchmark runner
-func runBenchmark(generator Generator, iterations, dataSize int) TestResult {
-	var totalTime time.Duration
+func runBenchmark(generator Generator, iterations, dataSize, chunkSize int) TestResult {
+	var totalTime, bestTime time.Duration
 	var totalChiSquare, totalShannonEntropy, totalNISTMonobitPValue float64
 	var passedNIST int
 
+	// Chunked runs reuse one preallocated buffer across iterations
+	chunked := chunkSize > 0 && chunkSize < dataSize
+	var buf []byte
+	if chunked {
+		buf = make([]byte, dataSize)
+	}
+
 	name := generator.Name()
 	fmt.Printf("\nTesting: %s\n", name)
 
@@ -118,8 +137,16 @@ func runBenchmark(generator Generator, iterations, dataSize int) TestResult {
 			showProgress(i+1, iterations, name)
 		}
 
+		var data []byte
+		var err error
+
 		start := time.Now()
-		data, err := generator.GenerateBytes(dataSize)
+		if chunked {
+			err = generateChunked(generator, buf, chunkSize)
+			data = buf
+		} else {
+			data, err = generator.GenerateBytes(dataSize)
+		}
 		duration := time.Since(start)
 
 		if err != nil {
@@ -128,6 +155,10 @@ func runBenchmark(generator Generator, iterations, dataSize int) TestResult {
 		}
 
 		totalTime += duration
+		// The fastest iteration filters out scheduler and GC noise
+		if bestTime == 0 || duration < bestTime {
+			bestTime = duration
+		}
 		totalChiSquare += calculateChiSquare(data)
 		totalShannonEntropy += calculateShannonEntropy(data)
 
@@ -140,11 +171,16 @@ func runBenchmark(generator Generator, iterations, dataSize int) TestResult {
 
 	fmt.Printf(" ✓\n")
 	avgOps := float64(iterations) / totalTime.Seconds()
+	var peakOps float64
+	if bestTime > 0 {
+		peakOps = 1 / bestTime.Seconds()
+	}
 
 	return TestResult{
 		Name:                 name,
 		TotalTime:            totalTime,
 		AvgOpsPerSec:         avgOps,
+		PeakOpsPerSec:        peakOps,
 		AvgChiSquare:         totalChiSquare / float64(iterations),
 		AvgShannonEntropy:    totalShannonEntropy / float64(iterations),
 		AvgNISTMonobitPValue: totalNISTMonobitPValue / float64(iterations),
@@ -158,14 +194,15 @@ func printResults(results []TestResult) {
 	fmt.Printf("\n=== Benchmark Results ===\n\n")
 
 	w := tabwriter.NewWriter(os.Stdout, 0, 0, 2, ' ', 0)
-	fmt.Fprintln(w, "Generator\tOps/sec\tChi-Square\tShannon\tNIST Pass Rate\tNIST P-Value")
-	fmt.Fprintln(w, "---------\t-------\t----------\t-------\t--------------\t------------")
+	fmt.Fprintln(w, "Generator\tOps/sec\tPeak Ops/sec\tChi-Square\tShannon\tNIST Pass Rate\tNIST P-Value")
+	fmt.Fprintln(w, "---------\t-------\t------------\t----------\t-------\t--------------\t------------")
 
 	for _, r := range results {
 		passRate := fmt.Sprintf("%.1f%%", (float64(r.PassedNISTMonobit)/float64(r.TotalIterations))*100)
-		fmt.Fprintf(w, "%s\t%.0f\t%.2f\t%.4f\t%s\t%.4f\n",
+		fmt.Fprintf(w, "%s\t%.0f\t%.0f\t%.2f\t%.4f\t%s\t%.4f\n",
 			r.Name,
 			r.AvgOpsPerSec,
+			r.PeakOpsPerSec,
 			r.AvgChiSquare,
 			r.AvgShannonEntropy,
 			passRate,
@@ -176,6 +213,7 @@ func printResults(results []TestResult) {
 
 	fmt.Println("\n=== Quality Metrics ===")
 	fmt.Println("• Ops/sec: Higher = better performance")
+	fmt.Println("• Peak Ops/sec: Rate of the fastest iteration, least affected by noise")
 	fmt.Println("• Chi-Square: ~255 = good uniformity")
 	fmt.Println("• Shannon: ~8.0 = maximum entropy")
 	fmt.Println("• NIST Pass: >95% = good randomness")
@@ -185,9 +223,10 @@ func main() {
 	// Configuration
 	iterations := 1000
 	dataSize := 1024 * 128
+	chunkSize := 0 // Bytes per GenerateBytes call; 0 requests dataSize at once
 
 	fmt.Printf("🎲 PRNG Benchmark Suite\n")
-	fmt.Printf("Iterations: %d | Data Size: %d bytes\n", iterations, dataSize)
+	fmt.Printf("Iterations: %d | Data Size: %d bytes | Chunk Size: %d bytes\n", iterations, dataSize, chunkSize)
 
 	// Initialize generators
 	fmt.Println("\n📊 Initializing generators...")
@@ -205,7 +244,7 @@ func main() {
 
 	var results []TestResult
 	for _, gen := range generators {
-		result := runBenchmark(gen, iterations, dataSize)
+		result := runBenchmark(gen, iterations, dataSize, chunkSize)
 		results = append(results, result)
 	}
 
@@ -33,22 +33,7 @@ func (p *MathPRNG) GenerateBytes(numBytes int) ([]byte, error) {
 
 	result := make([]byte, numBytes)
 
-	// Generate 4 bytes at a time for better performance
-	for i := 0; i < numBytes; i += 4 {
-		remaining := numBytes - i
-		val := p.rng.Uint32()
-
-		// Write up to 4 bytes
-		result[i] = byte(val)
-		if remaining > 1 {
-			result[i+1] = byte(val >> 8)
-		}
-		if remaining > 2 {
-			result[i+2] = byte(val >> 16)
-		}
-		if remaining > 3 {
-			result[i+3] = byte(val >> 24)
-		}
-	}
+	// Read fills the buffer byte by byte, drawing one Int63 per 7 bytes
+	p.rng.Read(result)
 	return result, nil
 }
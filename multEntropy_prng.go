@@ -3,12 +3,10 @@ package main
 import (
 	"crypto/hmac"
 	"crypto/sha256"
+	"crypto/sha3"
 	"encoding/binary"
-	"fmt"
 	"io"
 	"net/http"
-	"strconv"
-	"strings"
 	"sync"
 	"time"
 )
@@ -21,7 +19,7 @@ const (
 // multEntropyCSPRNG implements a multi-source entropy CSPRNG
 // using weather, market, and network data as entropy sources
 type multEntropyCSPRNG struct {
-	state          []byte
+	state          [sha256.Size]byte
 	counter        uint64
 	mutex          sync.Mutex
 	client         *http.Client
@@ -45,19 +43,18 @@ func (c *multEntropyCSPRNG) Name() string {
 
 // reseed gathers fresh entropy and mixes it into the state
 func (c *multEntropyCSPRNG) reseed() {
-	newEntropy := c.gatherEntropy()
-	
 	// Mix new entropy into the current state using HMAC
-	mac := hmac.New(sha256.New, c.state) // Use old state as key
-	mac.Write(newEntropy)
-	c.state = mac.Sum(nil)
+	mac := hmac.New(sha256.New, c.state[:]) // Use old state as key
+	c.gatherEntropy(mac)
+	mac.Sum(c.state[:0])
 	
 	c.lastReseed = time.Now()
 	c.bytesGenerated = 0
 }
 
-// gatherEntropy collects entropy from multiple sources concurrently
-func (c *multEntropyCSPRNG) gatherEntropy() []byte {
+// gatherEntropy collects entropy from multiple sources concurrently and
+// writes each source into dst in turn instead of joining them first
+func (c *multEntropyCSPRNG) gatherEntropy(dst io.Writer) {
 	var wg sync.WaitGroup
 	wg.Add(3)
 
@@ -78,9 +75,13 @@ func (c *multEntropyCSPRNG) gatherEntropy() []byte {
 
 	wg.Wait()
 
-	entropy := fmt.Sprintf("%s|%s|%s|%d", weatherData, marketData, networkData, time.Now().UnixNano())
-	hash := sha256.Sum256([]byte(entropy))
-	return hash[:]
+	for _, source := range []string{weatherData, marketData, networkData} {
+		io.WriteString(dst, source)
+		io.WriteString(dst, "|")
+	}
+	var timestamp [8]byte
+	binary.BigEndian.PutUint64(timestamp[:], uint64(time.Now().UnixNano()))
+	dst.Write(timestamp[:])
 }
 
 // getWeather fetches weather data as an entropy source
@@ -123,7 +124,7 @@ func (c *multEntropyCSPRNG) getNetworkJitter() string {
 		"https://www.mercadolibre.com.ar", // South America
 	}
 
-	var latencies []string
+	var latencies []byte
 	var wg sync.WaitGroup
 	var mu sync.Mutex
 
@@ -137,7 +138,7 @@ func (c *multEntropyCSPRNG) getNetworkJitter() string {
 			if err == nil {
 				resp.Body.Close()
 				mu.Lock()
-				latencies = append(latencies, strconv.FormatInt(duration.Nanoseconds(), 10))
+				latencies = binary.BigEndian.AppendUint64(latencies, uint64(duration.Nanoseconds()))
 				mu.Unlock()
 			}
 		}(endpoint)
@@ -147,7 +148,7 @@ func (c *multEntropyCSPRNG) getNetworkJitter() string {
 	if len(latencies) == 0 {
 		return "network_error_all"
 	}
-	return strings.Join(latencies, ",")
+	return string(latencies)
 }
 
 // GenerateBytes generates cryptographically secure random bytes
@@ -161,26 +162,21 @@ func (c *multEntropyCSPRNG) GenerateBytes(numBytes int) ([]byte, error) {
 	}
 
 	result := make([]byte, numBytes)
-	generated := 0
-
-	for generated < numBytes {
-		mac := hmac.New(sha256.New, c.state)
-		counterBytes := make([]byte, 8)
-		binary.BigEndian.PutUint64(counterBytes, c.counter)
-		mac.Write(counterBytes)
-		block := mac.Sum(nil)
 
-		toCopy := min(len(block), numBytes-generated)
-		copy(result[generated:], block[:toCopy])
-
-		generated += toCopy
-		c.counter++
-
-		// Update state for next block generation
-		updateMac := hmac.New(sha256.New, c.state)
-		updateMac.Write(block)
-		c.state = updateMac.Sum(nil)
-	}
+	// Squeeze the whole output from one SHAKE256 instance over state || counter
+	// instead of running two HMAC-SHA256 calls per 32-byte block
+	var counterBytes [8]byte
+	binary.BigEndian.PutUint64(counterBytes[:], c.counter)
+	shake := sha3.NewSHAKE256()
+	shake.Write(c.state[:])
+	shake.Write(counterBytes[:])
+	shake.Read(result)
+	c.counter++
+
+	// Update state with the last output block for forward secrecy
+	updateMac := hmac.New(sha256.New, c.state[:])
+	updateMac.Write(result[numBytes-min(numBytes, sha256.Size):])
+	updateMac.Sum(c.state[:0])
 
 	c.bytesGenerated += numBytes
 	return result, nil
@@ -4,7 +4,6 @@ import (
 	"crypto/hmac"
 	"crypto/sha256"
 	"encoding/binary"
-	"fmt"
 	"io"
 	"net/http"
 	"sync"
@@ -13,7 +12,7 @@ import (
 
 // WeatherCSPRNG implements a weather-based cryptographically secure pseudo-random number generator
 type WeatherCSPRNG struct {
-	state          []byte
+	state          [sha256.Size]byte
 	counter        uint64
 	mutex          sync.Mutex
 	client         *http.Client
@@ -36,31 +35,31 @@ func (w *WeatherCSPRNG) Name() string {
 }
 
 func (w *WeatherCSPRNG) reseed() {
-	newEntropy := w.getWeatherEntropy()
-
-	// Mix new entropy into the current state
-	mac := hmac.New(sha256.New, w.state)
-	mac.Write(newEntropy)
-	w.state = mac.Sum(nil)
+	// Mix new entropy into the current state, streaming it straight into the HMAC
+	mac := hmac.New(sha256.New, w.state[:])
+	w.getWeatherEntropy(mac)
+	mac.Sum(w.state[:0])
 
 	w.lastReseed = time.Now()
 	w.bytesGenerated = 0
 }
 
-func (w *WeatherCSPRNG) getWeatherEntropy() []byte {
+// getWeatherEntropy writes the weather response and its timing into dst
+func (w *WeatherCSPRNG) getWeatherEntropy(dst io.Writer) {
 	start := time.Now()
 	resp, err := w.client.Get("https://wttr.in/?format=j1")
 	duration := time.Since(start)
 
-	var body []byte
 	if err == nil {
 		defer resp.Body.Close()
-		body, _ = io.ReadAll(resp.Body) // Error ignored for benchmark simplicity
+		io.Copy(dst, resp.Body) // Error ignored for benchmark simplicity
 	}
 
-	entropy := fmt.Sprintf("%s|%d|%d", body, start.UnixNano(), duration.Nanoseconds())
-	hash := sha256.Sum256([]byte(entropy))
-	return hash[:]
+	var timing [17]byte
+	timing[0] = '|'
+	binary.BigEndian.PutUint64(timing[1:], uint64(start.UnixNano()))
+	binary.BigEndian.PutUint64(timing[9:], uint64(duration.Nanoseconds()))
+	dst.Write(timing[:])
 }
 
 // GenerateBytes generates cryptographically secure random bytes
@@ -74,26 +73,15 @@ func (w *WeatherCSPRNG) GenerateBytes(numBytes int) ([]byte, error) {
 	}
 
 	result := make([]byte, numBytes)
-	generated := 0
-
-	for generated < numBytes {
-		mac := hmac.New(sha256.New, w.state)
-		counterBytes := make([]byte, 8)
-		binary.BigEndian.PutUint64(counterBytes, w.counter)
-		mac.Write(counterBytes)
-		block := mac.Sum(nil)
+	numBlocks := (numBytes + sha256.Size - 1) / sha256.Size
 
-		toCopy := min(len(block), numBytes-generated)
-		copy(result[generated:], block[:toCopy])
+	block := generateBlocks(result, w.state[:], w.counter)
+	w.counter += uint64(numBlocks)
 
-		generated += toCopy
-		w.counter++
-
-		// Update state for next block generation
-		updateMac := hmac.New(sha256.New, w.state)
-		updateMac.Write(block)
-		w.state = updateMac.Sum(nil)
-	}
+	// Update state once per call; each block is already bound to a unique counter
+	updateMac := hmac.New(sha256.New, w.state[:])
+	updateMac.Write(block)
+	updateMac.Sum(w.state[:0])
 
 	w.bytesGenerated += numBytes
 	return result, nil